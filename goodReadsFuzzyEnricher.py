@@ -1,21 +1,31 @@
 import pandas as pd
+import numpy as np
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
+from bs4 import BeautifulSoup, SoupStrainer
 import time
 import re
 from urllib.parse import quote, urljoin
 from tqdm import tqdm
-import difflib
 import argparse
 import io
+import os
+import csv
 import sys
+import json
+import sqlite3
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import simpledialog
 from tkinter import filedialog
 
 # Check for optional dependencies
 try:
-    from rapidfuzz import fuzz
+    from rapidfuzz import fuzz, process
     RAPIDFUZZ_AVAILABLE = True
 except Exception:
     RAPIDFUZZ_AVAILABLE = False
@@ -24,103 +34,472 @@ try:
     PIL_AVAILABLE = True
 except Exception:
     PIL_AVAILABLE = False
+try:
+    import lxml  # noqa: F401  (only needed as BeautifulSoup's parser backend)
+    LXML_AVAILABLE = True
+except Exception:
+    LXML_AVAILABLE = False
+# libxml2-backed parsing is several times faster than the pure-Python html.parser
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except Exception:
+    HTTPX_AVAILABLE = False
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+    HTTP2_AVAILABLE = True
+except Exception:
+    HTTP2_AVAILABLE = False
     
 
+_EDITION_RE = re.compile(r'\b(anniversary|edition|illustrated|collector|gift|pack|hardcover|paperback|kindle|ebook)\b.*')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+
 def normalize_title(title):
     """Normalize book title for better matching."""
     if pd.isna(title) or title == '':
         return ''
     title = str(title).lower().strip()
     # Remove common edition/format info
-    title = re.sub(r'\b(anniversary|edition|illustrated|collector|gift|pack|hardcover|paperback|kindle|ebook)\b.*', '', title)
+    title = _EDITION_RE.sub('', title)
     # Remove punctuation except spaces and alphanumeric
-    title = re.sub(r'[^\w\s]', ' ', title)
+    title = _PUNCT_RE.sub(' ', title)
     # Remove extra spaces
-    title = ' '.join(title.split())
+    title = _WS_RE.sub(' ', title).strip()
     return title
 
-def search_goodreads(query, max_retries=3, max_results=5):
+def normalize_titles(titles):
+    """Vectorized `normalize_title` for a pandas Series of titles (NaN becomes '')."""
+    return (titles.fillna('').astype(str).str.lower().str.strip()
+            .str.replace(_EDITION_RE, '', regex=True)
+            .str.replace(_PUNCT_RE, ' ', regex=True)
+            .str.replace(_WS_RE, ' ', regex=True)
+            .str.strip())
+
+def jaro_winkler(s1, s2, prefix_weight=0.1):
+    """Jaro-Winkler similarity (0-1) of two strings, favouring a shared prefix."""
+    if s1 == s2:
+        return 1.0
+    len1, len2 = len(s1), len(s2)
+    if not len1 or not len2:
+        return 0.0
+    window = max(max(len1, len2) // 2 - 1, 0)
+    matched2 = [False] * len2
+    matches1 = []
+    for i, ch in enumerate(s1):
+        for j in range(max(0, i - window), min(len2, i + window + 1)):
+            if not matched2[j] and s2[j] == ch:
+                matched2[j] = True
+                matches1.append(ch)
+                break
+    m = len(matches1)
+    if not m:
+        return 0.0
+    matches2 = [s2[j] for j in range(len2) if matched2[j]]
+    transpositions = sum(a != b for a, b in zip(matches1, matches2)) // 2
+    jaro = (m / len1 + m / len2 + (m - transpositions) / m) / 3
+    # Winkler's prefix boost only applies to pairs that are already similar
+    if jaro <= 0.7:
+        return jaro
+    prefix = 0
+    for a, b in zip(s1[:4], s2[:4]):
+        if a != b:
+            break
+        prefix += 1
+    return jaro + prefix * prefix_weight * (1 - jaro)
+
+def fallback_similarity(norm_query, norm_title):
+    """Pure-Python similarity (0-1) used when rapidfuzz is not installed.
+    Combines token Jaccard with Jaro-Winkler, which is much cheaper than difflib's sequence matcher.
+    """
+    q_tokens = set(norm_query.split())
+    t_tokens = set(norm_title.split())
+    union = len(q_tokens | t_tokens)
+    jacc = len(q_tokens & t_tokens) / union if union else 0.0
+    return 0.6 * jacc + 0.4 * jaro_winkler(norm_query, norm_title)
+
+def score_candidates(norm_queries, candidate_lists):
+    """Score each query against its own candidates' titles in one batch.
+    Returns one NumPy array of 0-1 scores per query (empty when it has no candidates).
+    """
+    counts = [len(cands) for cands in candidate_lists]
+    if not sum(counts):
+        return [np.zeros(0, dtype=np.float32) for _ in counts]
+    norm_titles = normalize_titles(pd.Series([c['exact_title'] for cands in candidate_lists for c in cands])).tolist()
+    pair_queries = np.repeat(np.asarray(norm_queries, dtype=object), counts).tolist()
+    if RAPIDFUZZ_AVAILABLE and hasattr(process, 'cpdist'):
+        # Pairwise scoring releases the GIL and spreads the work across all cores.
+        # token_set_ratio is robust to reorderings and extra tokens; WRatio penalizes
+        # length mismatches (e.g. a series title vs. a single volume)
+        token_set = process.cpdist(pair_queries, norm_titles, scorer=fuzz.token_set_ratio,
+                                   dtype=np.float32, workers=-1)
+        weighted = process.cpdist(pair_queries, norm_titles, scorer=fuzz.WRatio,
+                                  dtype=np.float32, workers=-1)
+        flat = (0.6 * token_set + 0.4 * weighted) / 100.0
+    elif RAPIDFUZZ_AVAILABLE:
+        # rapidfuzz < 3.6 has no cpdist; apply the same blend one pair at a time
+        flat = np.array([0.6 * fuzz.token_set_ratio(q, t) + 0.4 * fuzz.WRatio(q, t)
+                         for q, t in zip(pair_queries, norm_titles)], dtype=np.float32) / 100.0
+    else:
+        flat = np.array([fallback_similarity(q, t) for q, t in zip(pair_queries, norm_titles)], dtype=np.float32)
+    return np.split(flat, np.cumsum(counts)[:-1])
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive'
+}
+
+# On-disk cache of search results so reruns and interrupted runs skip repeat fetches (None disables it)
+CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'goodreads_cache.sqlite')
+
+# Throttling and server errors are retried by urllib3 with exponential back-off,
+# waiting as long as Goodreads asks for in its Retry-After header
+_RETRY = Retry(total=3, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504),
+               allowed_methods=frozenset(['GET']), respect_retry_after_header=True)
+
+# Shared session so every search reuses pooled keep-alive connections to goodreads.com
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_POOL_SIZE = 16
+_SESSION.mount('https://', HTTPAdapter(pool_maxsize=_POOL_SIZE, max_retries=_RETRY))
+
+def _ensure_pool_size(size):
+    """Grow the session's connection pool so `size` threads can each keep a connection alive."""
+    global _POOL_SIZE
+    if size > _POOL_SIZE:
+        _POOL_SIZE = size
+        _SESSION.mount('https://', HTTPAdapter(pool_maxsize=size, max_retries=_RETRY))
+
+def _search_url(query):
+    """Build the Goodreads search URL for a (raw) book title."""
+    return f"https://www.goodreads.com/search?q={quote(normalize_title(query))}"
+
+def _autocomplete_url(query):
+    """Build the URL of Goodreads' compact JSON autocomplete endpoint for a (raw) book title."""
+    return f"https://www.goodreads.com/book/auto_complete?format=json&q={quote(normalize_title(query))}"
+
+def _retry_after(value, default):
+    """Seconds to wait according to a Retry-After header, or `default` if missing/unparseable."""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return default
+
+# Patterns used for every result row, compiled once
+_BOOK_HREF_RE = re.compile(r'/book/show/')
+_AUTHOR_HREF_RE = re.compile(r'/author/show/')
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+_RATINGS_RE = re.compile(r"([0-9][0-9,]*)\s+rating", re.IGNORECASE)
+
+_BOOK_ROW_STRAINER = SoupStrainer('tr', attrs={'itemtype': 'http://schema.org/Book'})
+# Match the class as a whole-word regex: strained parses compare against the full class attribute,
+# so a plain class list would miss containers such as <div class="bookBox wide">
+_FALLBACK_STRAINER = SoupStrainer(['div', 'table'], class_=re.compile(r'(^|\s)(bookBox|tableList)(\s|$)'))
+
+def parse_search_results(content, max_results=5):
+    """Parse a Goodreads search results page into a list of candidate metadata dicts."""
+    # Only build the DOM for the book rows; headers, nav and footers are skipped
+    soup = BeautifulSoup(content, HTML_PARSER, parse_only=_BOOK_ROW_STRAINER)
+    results = soup.find_all('tr', {'itemtype': 'http://schema.org/Book'})
+    if not results:
+        # Try the alternative layouts, still parsing only the containers we look at
+        soup = BeautifulSoup(content, HTML_PARSER, parse_only=_FALLBACK_STRAINER)
+        results = soup.find_all('div', class_='bookBox')
+    if not results:
+        results = soup.find_all('table', class_='tableList')
+        if results:
+            results = results[0].find_all('tr')[1:]  # Skip header row
+    if not results:
+        return []
+
+    candidates = []
+    for res in results:
+        if len(candidates) >= max_results:
+            break
+        title_elem = res.find('a', class_='bookTitle') or res.find('a', href=_BOOK_HREF_RE)
+        exact_title = title_elem.get_text(strip=True) if title_elem else ''
+        book_url = urljoin('https://www.goodreads.com', title_elem['href']) if title_elem and title_elem.get('href') else ''
+        author_elem = res.find('a', class_='authorName') or res.find('a', href=_AUTHOR_HREF_RE)
+        author = author_elem.get_text(strip=True) if author_elem else ''
+        pub_date = ''
+        ratings_count = 0
+        pub_elem = res.find('span', class_='greyText smallText uitext')
+        if pub_elem:
+            pub_text = pub_elem.get_text(strip=True)
+            year_match = _YEAR_RE.search(pub_text)
+            if year_match:
+                pub_date = year_match.group()
+            # Try to extract number of ratings from the same element (e.g. "1,234 ratings")
+            ratings_count = 0
+            try:
+                ratings_match = _RATINGS_RE.search(pub_text)
+                if ratings_match:
+                    ratings_count = int(ratings_match.group(1).replace(',', ''))
+            except Exception:
+                ratings_count = 0
+        # Try to extract an image URL from the result
+        img_elem = res.find('img')
+        image_url = ''
+        if img_elem:
+            image_url = img_elem.get('src') or img_elem.get('data-src') or ''
+            # Some src may be relative or contain parameters; try to clean
+            if image_url and image_url.startswith('//'):
+                image_url = 'https:' + image_url
+        candidates.append({
+            'exact_title': exact_title,
+            'author': author,
+            'publish_date': pub_date,
+            'ratings_count': ratings_count,
+            'goodreads_url': book_url,
+            'image_url': image_url
+        })
+    return candidates
+
+def parse_autocomplete_results(content, max_results=5):
+    """Parse a Goodreads autocomplete JSON payload into candidate metadata dicts.
+    The payload has no publication year, so `publish_date` is always empty.
+    """
+    try:
+        items = json.loads(content)
+    except ValueError:
+        return []
+    if not isinstance(items, list):
+        return []
+    candidates = []
+    for item in items:
+        if len(candidates) >= max_results:
+            break
+        # Skip anything that does not look like a book entry rather than failing the whole search
+        if not isinstance(item, dict):
+            continue
+        book_url = item.get('bookUrl') or ''
+        author = item.get('author')
+        try:
+            ratings_count = int(str(item.get('ratingsCount') or 0).replace(',', ''))
+        except ValueError:
+            ratings_count = 0
+        candidates.append({
+            'exact_title': item.get('title') or '',
+            'author': (author.get('name') or '') if isinstance(author, dict) else '',
+            'publish_date': '',
+            'ratings_count': ratings_count,
+            'goodreads_url': urljoin('https://www.goodreads.com', book_url) if book_url else '',
+            'image_url': item.get('imageUrl') or ''
+        })
+    return candidates
+
+class SearchCache:
+    """Small sqlite key-value store that keeps search results across runs."""
+    def __init__(self, path):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute('CREATE TABLE IF NOT EXISTS searches ('
+                               'url TEXT, max_results INTEGER, payload TEXT, PRIMARY KEY (url, max_results))')
+
+    def get(self, url, max_results):
+        with self._lock:
+            row = self._conn.execute('SELECT payload FROM searches WHERE url = ? AND max_results = ?',
+                                     (url, max_results)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, url, max_results, candidates):
+        with self._lock, self._conn:
+            self._conn.execute('INSERT OR REPLACE INTO searches (url, max_results, payload) VALUES (?, ?, ?)',
+                               (url, max_results, json.dumps(candidates)))
+
+_search_cache = None
+
+def get_search_cache():
+    """Return the shared on-disk search cache, or None if caching is disabled or unavailable."""
+    global _search_cache
+    if _search_cache is None and CACHE_FILE:
+        try:
+            _search_cache = SearchCache(CACHE_FILE)
+        except sqlite3.Error:
+            return None
+    return _search_cache
+
+def _get_candidates(url, parse, max_results):
+    try:
+        response = _SESSION.get(url, timeout=10)
+        response.raise_for_status()
+    except requests.RequestException:
+        # Raised once the adapter's retries are exhausted
+        return []
+    try:
+        return parse(response.content, max_results)
+    except Exception:
+        return []
+
+@lru_cache(maxsize=4096)
+def _search_cached(search_url, max_results, autocomplete_url=None):
+    cache_key = autocomplete_url or search_url
+    cache = get_search_cache()
+    if cache:
+        cached = cache.get(cache_key, max_results)
+        if cached is not None:
+            return cached
+    candidates = []
+    if autocomplete_url:
+        candidates = _get_candidates(autocomplete_url, parse_autocomplete_results, max_results)
+    if not candidates:
+        candidates = _get_candidates(search_url, parse_search_results, max_results)
+    # Only successful, non-empty searches are persisted so failures get retried next run
+    if cache and candidates:
+        cache.put(cache_key, max_results, candidates)
+    return candidates
+
+def search_goodreads(query, max_retries=3, max_results=5, use_autocomplete=False):
     """Search Goodreads for a book and return a list of candidate metadata dicts.
     Returns up to `max_results` candidates (may be empty list on failure).
+    With `use_autocomplete`, the compact JSON endpoint is tried before the HTML search page.
+    Retries with back-off are handled by the `_SESSION` adapter, so `max_retries` is only
+    accepted for compatibility; results are memoized by normalized query in memory and in
+    the on-disk `SearchCache`.
+    """
+    return _search_cached(_search_url(query), max_results,
+                          _autocomplete_url(query) if use_autocomplete else None)
+
+class _RateLimiter:
+    """Spaces request starts at least `delay` seconds apart across all threads sharing it."""
+    def __init__(self, delay):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            if self._next_slot > now:
+                time.sleep(self._next_slot - now)
+                now = self._next_slot
+            self._next_slot = now + self.delay
+
+class _AsyncRateLimiter:
+    """Spaces request starts at least `delay` seconds apart across all tasks sharing it."""
+    def __init__(self, delay):
+        self.delay = delay
+        self._lock = asyncio.Lock()
+        self._next_slot = 0.0
+
+    async def wait(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if self._next_slot > now:
+                await asyncio.sleep(self._next_slot - now)
+                now = self._next_slot
+            self._next_slot = now + self.delay
+
+async def _get_async(client, url, sem, limiter, max_retries=3):
+    """GET `url`, retrying network errors, throttling and server errors with back-off.
+    Returns the response body, or None if the request failed.
     """
-    normalized_query = normalize_title(query)
-    search_url = f"https://www.goodreads.com/search?q={quote(normalized_query)}"
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive'
-    }
     for attempt in range(max_retries):
+        backoff = 2 ** attempt
         try:
-            response = requests.get(search_url, headers=headers, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            # Try multiple selectors for robustness
-            results = soup.find_all('tr', {'itemtype': 'http://schema.org/Book'})
-            if not results:
-                results = soup.find_all('div', class_='bookBox')
-            if not results:
-                results = soup.find_all('table', class_='tableList')
-                if results:
-                    results = results[0].find_all('tr')[1:]  # Skip header row
-            if not results:
-                return []
-
-            candidates = []
-            for res in results:
-                if len(candidates) >= max_results:
-                    break
-                title_elem = res.find('a', class_='bookTitle')
-                if not title_elem:
-                    title_elem = res.find('a', href=re.compile(r'/book/show/'))
-                exact_title = title_elem.get_text(strip=True) if title_elem else ''
-                book_url = urljoin('https://www.goodreads.com', title_elem['href']) if title_elem and title_elem.get('href') else ''
-                author_elem = res.find('a', class_='authorName')
-                if not author_elem:
-                    author_elem = res.find('a', href=re.compile(r'/author/show/'))
-                author = author_elem.get_text(strip=True) if author_elem else ''
-                pub_date = ''
-                ratings_count = 0
-                pub_elem = res.find('span', class_='greyText smallText uitext')
-                if pub_elem:
-                    pub_text = pub_elem.get_text(strip=True)
-                    year_match = re.search(r'\b(19|20)\d{2}\b', pub_text)
-                    if year_match:
-                        pub_date = year_match.group()
-                    # Try to extract number of ratings from the same element (e.g. "1,234 ratings")
-                    ratings_count = 0
-                    try:
-                        ratings_match = re.search(r"([0-9][0-9,]*)\s+rating", pub_text, flags=re.IGNORECASE)
-                        if ratings_match:
-                            ratings_count = int(ratings_match.group(1).replace(',', ''))
-                    except Exception:
-                        ratings_count = 0
-                # Try to extract an image URL from the result
-                img_elem = res.find('img')
-                image_url = ''
-                if img_elem:
-                    image_url = img_elem.get('src') or img_elem.get('data-src') or ''
-                    # Some src may be relative or contain parameters; try to clean
-                    if image_url and image_url.startswith('//'):
-                        image_url = 'https:' + image_url
-                candidates.append({
-                    'exact_title': exact_title,
-                    'author': author,
-                    'publish_date': pub_date,
-                    'ratings_count': ratings_count,
-                    'goodreads_url': book_url,
-                    'image_url': image_url
-                })
-            return candidates
-        except requests.RequestException:
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)
+            async with sem:
+                await limiter.wait()
+                response = await client.get(url)
+            # Honor the server's throttling hint on 429/5xx; other client errors are final
+            if response.status_code == 429 or response.status_code >= 500:
+                backoff = _retry_after(response.headers.get('Retry-After'), backoff)
+            elif response.status_code >= 400:
+                return None
             else:
-                return []
-        except Exception:
-            return []
+                return response.content
+        except httpx.HTTPError:
+            pass
+        if attempt < max_retries - 1:
+            await asyncio.sleep(backoff)
+    return None
+
+async def search_goodreads_async(client, query, sem, limiter, max_retries=3, max_results=5, use_autocomplete=False):
+    """Async counterpart of `search_goodreads` using a shared httpx.AsyncClient.
+    `sem` bounds the number of in-flight requests and `limiter` keeps the overall request rate polite.
+    """
+    try:
+        if use_autocomplete:
+            content = await _get_async(client, _autocomplete_url(query), sem, limiter, max_retries)
+            try:
+                candidates = parse_autocomplete_results(content, max_results) if content else []
+            except Exception:
+                # Fall through to the HTML page, as the sync path does
+                candidates = []
+            if candidates:
+                return candidates
+        content = await _get_async(client, _search_url(query), sem, limiter, max_retries)
+        return parse_search_results(content, max_results) if content else []
+    except Exception:
+        return []
+
+async def _fetch_candidates_async(pending, delay, concurrency, max_results, use_autocomplete, cache=None):
+    sem = asyncio.Semaphore(concurrency)
+    limiter = _AsyncRateLimiter(delay)
+    # With h2 installed all searches are multiplexed over a single TLS connection.
+    # Connection is a hop-by-hop header that HTTP/2 forbids, so it is not sent.
+    headers = {k: v for k, v in HEADERS.items() if k != 'Connection'}
+    limits = httpx.Limits(max_keepalive_connections=8, max_connections=32)
+    async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, headers=headers, timeout=10.0, limits=limits,
+                                 follow_redirects=True) as client:
+        with tqdm(total=len(pending), desc="Searching Goodreads") as pbar:
+            async def run(url, query):
+                candidates = await search_goodreads_async(client, query, sem, limiter, max_results=max_results,
+                                                          use_autocomplete=use_autocomplete)
+                # Store each result as it arrives so an interrupted run keeps what it already fetched
+                if cache and candidates:
+                    cache.put(url, max_results, candidates)
+                pbar.update(1)
+                return candidates
+            return await asyncio.gather(*(run(url, q) for url, q in pending.items()))
+
+def fetch_candidates(queries, delay=0.5, concurrency=16, max_results=5, use_autocomplete=False):
+    """Search Goodreads for every query and return the candidate lists in the same order.
+    Queries that normalize to the same search are fetched once, and results already in the
+    on-disk cache are not fetched at all. Uses concurrent httpx requests when available,
+    otherwise a thread pool of `concurrency` workers over the shared requests session.
+    """
+    # Cache entries are keyed by the first URL tried for a query
+    urls = [_autocomplete_url(q) if use_autocomplete else _search_url(q) for q in queries]
+    cache = get_search_cache()
+    results = {}
+    pending = {}
+    for url, query in zip(urls, queries):
+        if url in results or url in pending:
+            continue
+        cached = cache.get(url, max_results) if cache else None
+        if cached is not None:
+            results[url] = cached
+        else:
+            pending[url] = query
+    if HTTPX_AVAILABLE:
+        fetched = asyncio.run(_fetch_candidates_async(pending, delay, concurrency, max_results, use_autocomplete,
+                                                   cache))
+        results.update(zip(pending, fetched))
+    else:
+        # Threads overlap the blocking requests just as well, since the GIL is released during socket I/O
+        limiter = _RateLimiter(delay)
+        _ensure_pool_size(concurrency)
+        def search(query):
+            limiter.wait()
+            return search_goodreads(query, max_results=max_results, use_autocomplete=use_autocomplete)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            fetched = list(tqdm(executor.map(search, pending.values()), total=len(pending), desc="Searching Goodreads"))
+        results.update(zip(pending, fetched))
+    return [results[url] for url in urls]
+
+def fetch_cover_image(url):
+    """Download a cover image and return it as a PIL image scaled for the picker dialog."""
+    resp = _SESSION.get(url, timeout=6)
+    resp.raise_for_status()
+    img = Image.open(io.BytesIO(resp.content))
+    img.thumbnail((420, 600))
+    return img
 
 def ask_user_choice_with_images(root, book_name, candidates):
     """Show a dialog that displays up to 3 candidates with covers and lets the user page through results.
@@ -134,8 +513,19 @@ def ask_user_choice_with_images(root, book_name, candidates):
             self.page = 0
             self.per_page = 3
             self.selected_idx = None
-            self.photo_refs = []
+            self.photo_cache = {}
             self.none_selected = False
+            # Pending cover callbacks by label, so they can be cancelled before the dialog is destroyed
+            self.cover_jobs = {}
+            # Start downloading every candidate's cover in parallel before anything is shown
+            self.image_futures = {}
+            self.executor = None
+            if PIL_AVAILABLE:
+                self.executor = ThreadPoolExecutor(max_workers=5)
+                for cand in candidates:
+                    url = cand.get('image_url')
+                    if url and url not in self.image_futures:
+                        self.image_futures[url] = self.executor.submit(fetch_cover_image, url)
             self.top = tk.Toplevel(parent)
             self.top.title('Select book match')
             self.top.transient(parent)
@@ -152,6 +542,39 @@ def ask_user_choice_with_images(root, book_name, candidates):
             self.build_widgets()
             self.render_page()
             parent.wait_window(self.top)
+            if self.executor:
+                # Drop covers still queued; shutdown(wait=False) alone would download them anyway
+                for future in self.image_futures.values():
+                    future.cancel()
+                self.executor.shutdown(wait=False)
+
+        def get_photo(self, url):
+            """Return the PhotoImage for `url` (None if it failed); its download must have finished."""
+            if url not in self.photo_cache:
+                try:
+                    self.photo_cache[url] = ImageTk.PhotoImage(self.image_futures[url].result())
+                except Exception:
+                    self.photo_cache[url] = None
+            return self.photo_cache[url]
+
+        def show_cover(self, lbl, url):
+            """Put the cover for `url` on `lbl` once it has downloaded, polling from the Tk loop so it never blocks."""
+            self.cover_jobs.pop(str(lbl), None)
+            try:
+                # The page may have changed or the dialog closed while the image was loading
+                if not lbl.winfo_exists():
+                    return
+            except tk.TclError:
+                return
+            if url not in self.photo_cache and not self.image_futures[url].done():
+                self.cover_jobs[str(lbl)] = self.top.after(50, self.show_cover, lbl, url)
+                return
+            photo = self.get_photo(url)
+            if photo:
+                lbl.config(image=photo, text='')
+                lbl.image = photo
+            else:
+                lbl.config(text='[no image]')
 
         def build_widgets(self):
             tk.Label(self.top, text=f"Multiple matches found for: {self.book_name}").pack(padx=8, pady=6)
@@ -169,7 +592,6 @@ def ask_user_choice_with_images(root, book_name, candidates):
         def render_page(self):
             for child in self.frame.winfo_children():
                 child.destroy()
-            self.photo_refs = []
             start = self.page * self.per_page
             end = start + self.per_page
             slice = self.candidates[start:end]
@@ -182,26 +604,11 @@ def ask_user_choice_with_images(root, book_name, candidates):
                 f = tk.Frame(self.frame, relief='groove', bd=1)
                 f.pack(side='left', padx=6, pady=4)
                 if PIL_AVAILABLE and cand.get('image_url'):
-                    # Place a placeholder so the dialog shows immediately
+                    # Place a placeholder so the dialog shows immediately; the cover is
+                    # swapped in after the page has painted
                     lbl = tk.Label(f, text='[loading image]')
                     lbl.pack()
-                    # Ensure UI updates so the Toplevel is visible before network fetch
-                    try:
-                        self.top.update_idletasks()
-                    except Exception:
-                        pass
-                    # Try to fetch and display the image (network may block briefly)
-                    try:
-                        resp = requests.get(cand['image_url'], timeout=6)
-                        resp.raise_for_status()
-                        img = Image.open(io.BytesIO(resp.content))
-                        img.thumbnail((420, 600))
-                        photo = ImageTk.PhotoImage(img)
-                        lbl.config(image=photo, text='')
-                        lbl.image = photo
-                        self.photo_refs.append(photo)
-                    except Exception:
-                        lbl.config(text='[no image]')
+                    self.cover_jobs[str(lbl)] = self.top.after_idle(self.show_cover, lbl, cand['image_url'])
                 else:
                     tk.Label(f, text='[no image]').pack()
                 title = cand.get('exact_title', '')
@@ -213,22 +620,31 @@ def ask_user_choice_with_images(root, book_name, candidates):
             self.page += 1
             self.render_page()
 
-        def on_none(self):
-            self.none_selected = True
+        def close(self):
+            # Destroying the Toplevel deletes the Tcl commands behind its pending after() callbacks,
+            # so cancel them first rather than let Tk report invalid commands
+            for job in self.cover_jobs.values():
+                try:
+                    self.top.after_cancel(job)
+                except tk.TclError:
+                    pass
+            self.cover_jobs.clear()
             self.top.destroy()
             self.top.update()  # Force update to remove window from screen
 
+        def on_none(self):
+            self.none_selected = True
+            self.close()
+
         def on_cancel(self):
             self.selected_idx = None
-            self.top.destroy()
-            self.top.update()  # Force update to remove window from screen
+            self.close()
 
         def on_ok(self):
             val = self.var.get()
             if val is not None and val >= 0:
                 self.selected_idx = val
-            self.top.destroy()
-            self.top.update()  # Force update to remove window from screen
+            self.close()
 
     dlg = ManualMatchDialog(root, book_name, candidates)
 
@@ -238,92 +654,153 @@ def ask_user_choice_with_images(root, book_name, candidates):
         return candidates[dlg.selected_idx]
     return None
 
+ENRICHED_COLUMNS = ['exact_book_name', 'author', 'publish_date', 'ratings_count', 'goodreads_link']
+EMPTY_MATCH = {'exact_title': '', 'author': '', 'publish_date': '', 'ratings_count': 0, 'goodreads_url': ''}
+# pandas' default NA markers; the CSV is read with na_filter=False so they are matched here instead
+NA_VALUES = {'', '#n/a', '#n/a n/a', '#na', '-1.#ind', '-1.#qnan', '-nan', '1.#ind', '1.#qnan', '<na>', 'n/a',
+             'na', 'nan', 'null', 'none'}
+# Rows searched and matched per batch; the first rows are written after one batch, not the whole file
+CHUNKSIZE = 200
+
+def choose_candidate(book_name, candidates, scores, no_confirm=False, auto_score_threshold=0.80, gap_threshold=0.12):
+    """Pick the best candidate for `book_name`, asking the user when the scores are ambiguous.
+    Returns the chosen candidate dict, or an empty match if there is none.
+    """
+    if not candidates:
+        return dict(EMPTY_MATCH)
+    if len(candidates) == 1:
+        return candidates[0]
+    # If top match is clearly better than second, or is very high absolute score, auto-select it
+    # Only the two best scores matter here, so use an O(n) partial selection rather than a sort;
+    # argmax keeps the first candidate among ties, as the stable sort did
+    top_idx = int(np.argmax(scores))
+    top = scores[top_idx]
+    second = np.partition(scores, -2)[-2]
+    if no_confirm or top >= auto_score_threshold or (top - second) >= gap_threshold:
+        return candidates[top_idx]
+    # Show candidates ordered by score in the image dialog (it pages in sets of 3)
+    sorted_idx = np.argsort(-scores, kind='stable')
+    ordered_candidates = [candidates[i] for i in sorted_idx]
+    selected = ask_user_choice_with_images(root, book_name, ordered_candidates)
+    return selected if selected else dict(EMPTY_MATCH)
+
+def iter_enriched_rows(df, book_column, delay=0.5, no_confirm=False, auto_score_threshold=0.80,
+                       gap_threshold=0.12, concurrency=16, use_autocomplete=False):
+    """Yield each row of `df` as a dict with the Goodreads metadata columns added, in order.
+    All searches are fetched and scored before the first row is yielded; ambiguous matches
+    are resolved as the rows are consumed.
+    """
+    book_names = df[book_column].tolist()
+    normalized_names = normalize_titles(df[book_column]).to_numpy()
+
+    # Fetch all candidates up front so the network searches can overlap
+    positions = [i for i, book_name in enumerate(book_names) if str(book_name).strip().lower() not in NA_VALUES]
+    all_candidates = fetch_candidates([book_names[i] for i in positions], delay=delay, concurrency=concurrency,
+                                      use_autocomplete=use_autocomplete)
+
+    # Score every ambiguous row's candidates in a single batch before the selection loop
+    all_scores = score_candidates([normalized_names[pos] for pos in positions],
+                                  [c if len(c) > 1 else [] for c in all_candidates])
+    matches = dict(zip(positions, zip(all_candidates, all_scores)))
+
+    # Rows are built one at a time so only the current row exists as a dict
+    columns = list(df.columns)
+    for pos, values in enumerate(df.itertuples(index=False, name=None)):
+        row = dict(zip(columns, values))
+        chosen = EMPTY_MATCH
+        if pos in matches:
+            candidates, scores = matches[pos]
+            chosen = choose_candidate(book_names[pos], candidates, scores, no_confirm=no_confirm,
+                                      auto_score_threshold=auto_score_threshold, gap_threshold=gap_threshold)
+        row['exact_book_name'] = chosen.get('exact_title', '')
+        row['author'] = chosen.get('author', '')
+        row['publish_date'] = chosen.get('publish_date', '')
+        row['ratings_count'] = chosen.get('ratings_count', 0)
+        row['goodreads_link'] = chosen.get('goodreads_url', '')
+        yield row
+
+def _count_written_rows(output_file, fieldnames):
+    """Number of data rows already in `output_file`, or None if it is missing or has other columns."""
+    try:
+        with open(output_file, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            if next(reader, None) != fieldnames:
+                return None
+            return sum(1 for _ in reader)
+    except OSError:
+        return None
+
 def process_book_csv(input_file, book_column, output_file=None, delay=0.5, no_confirm=False,
-                     auto_score_threshold=0.80, gap_threshold=0.12):
+                     auto_score_threshold=0.80, gap_threshold=0.12, concurrency=16, chunksize=CHUNKSIZE,
+                     use_autocomplete=False, resume=False):
     """
     Process a CSV file with book names and add Goodreads metadata.
+    The CSV is searched and matched `chunksize` rows at a time, and each batch is written
+    before the next is fetched, so an interrupted run keeps every finished batch (and the
+    searches of the current one stay in the cache). Rerun with `resume` to continue after the
+    last written row; without it the output is rewritten from scratch (searches come from the
+    cache, but ambiguous matches are asked again).
     Parameters:
         input_file: Path to input CSV file
         book_column: Name of the column containing book titles
         output_file: Path to output CSV file (optional)
-        delay: Delay between requests in seconds
+        delay: Minimum delay between request starts in seconds
+        concurrency: Maximum number of Goodreads searches in flight at once
+        chunksize: Number of rows read, searched and written per batch; None processes the
+            whole file as one batch
+        use_autocomplete: Try Goodreads' compact autocomplete endpoint before the HTML search page
+            (much less data per search, but matches found that way have no publication year)
+        resume: Keep the rows already in `output_file` (if it has the same columns) and only
+            process the input rows after them
+    Returns the path of the written CSV file.
     """
-    df = pd.read_csv(input_file)
-    total = len(df)
-    print(f"Processing {total} entries from '{input_file}'...")
-    
-    if book_column not in df.columns:
-        raise ValueError(f"Column '{book_column}' not found in CSV. Available columns: {list(df.columns)}")
-    df['exact_book_name'] = ''
-    df['author'] = ''
-    df['publish_date'] = ''
-    df['ratings_count'] = 0
-    df['goodreads_link'] = ''
-    
-    
-    for index, row in tqdm(df.iterrows(), total=total, desc="Enriching with Goodreads data"):
-        book_name = row[book_column]
-        if pd.isna(book_name) or book_name == '':
-            continue
-        candidates = search_goodreads(book_name)
-        chosen = None
-        if not candidates:
-            chosen = {'exact_title': '', 'author': '', 'publish_date': '', 'ratings_count': 0, 'goodreads_url': ''}
-        elif len(candidates) == 1:
-            chosen = candidates[0]
-        else:
-            # Compute similarity scores between query and candidate titles
-            titles = [c['exact_title'] for c in candidates]
-            norm_query = normalize_title(book_name)
-            scores = []
-            for t in titles:
-                nt = normalize_title(t)
-                if RAPIDFUZZ_AVAILABLE:
-                    # token_set_ratio is robust to reorderings and extra tokens
-                    s = fuzz.token_set_ratio(norm_query, nt) / 100.0
-                else:
-                    # fallback: combine token jaccard with sequence matcher ratio
-                    q_tokens = set(norm_query.split())
-                    t_tokens = set(nt.split())
-                    if q_tokens or t_tokens:
-                        inter = len(q_tokens & t_tokens)
-                        union = len(q_tokens | t_tokens)
-                        jacc = inter / union if union else 0.0
-                    else:
-                        jacc = 0.0
-                    seq = difflib.SequenceMatcher(None, norm_query, nt).ratio()
-                    s = 0.6 * jacc + 0.4 * seq
-                scores.append(s)
-            # If top match is clearly better than second, or is very high absolute score, auto-select it
-            sorted_idx = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
-            top_idx = sorted_idx[0]
-            top = scores[top_idx]
-            second = scores[sorted_idx[1]] if len(scores) > 1 else 0
-            if no_confirm or top >= auto_score_threshold or (top - second) >= gap_threshold:
-                chosen = candidates[top_idx]
-            else:
-                # Show candidates ordered by score in the image dialog (it pages in sets of 3)
-                ordered_candidates = [candidates[i] for i in sorted_idx]
-
-                selected = ask_user_choice_with_images(root, book_name, ordered_candidates)
-                if selected:
-                    chosen = selected
-                else:
-                    chosen = {'exact_title': '', 'author': '', 'publish_date': '', 'ratings_count': 0, 'goodreads_url': ''}
-
-        df.loc[index, 'exact_book_name'] = chosen.get('exact_title', '')
-        df.loc[index, 'author'] = chosen.get('author', '')
-        df.loc[index, 'publish_date'] = chosen.get('publish_date', '')
-        df.loc[index, 'ratings_count'] = chosen.get('ratings_count', 0)
-        df.loc[index, 'goodreads_link'] = chosen.get('goodreads_url', '')
-        time.sleep(delay)
-        
-    # Save to output file
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    columns = pd.read_csv(input_file, nrows=0).columns
+    if book_column not in columns:
+        raise ValueError(f"Column '{book_column}' not found in CSV. Available columns: {list(columns)}")
     if output_file is None:
         output_file = input_file.replace('.csv', '_with_goodreads.csv')
-    df.to_csv(output_file, index=False)
+    options = dict(delay=delay, no_confirm=no_confirm, auto_score_threshold=auto_score_threshold,
+                   gap_threshold=gap_threshold, concurrency=concurrency, use_autocomplete=use_autocomplete)
+    # Every column is passed through as text, so skip type inference and NaN detection
+    read_options = dict(dtype=str, engine='c', na_filter=False)
+
+    if chunksize is None:
+        chunks = [pd.read_csv(input_file, **read_options)]
+        print(f"Processing {len(chunks[0])} entries from '{input_file}'...")
+    else:
+        chunks = pd.read_csv(input_file, chunksize=chunksize, **read_options)
+        print(f"Processing '{input_file}' in chunks of {chunksize} entries...")
+
+    # Existing columns with the same names as the metadata columns are overwritten in place
+    fieldnames = list(columns) + [c for c in ENRICHED_COLUMNS if c not in columns]
+    done = _count_written_rows(output_file, fieldnames) if resume else None
+    if done:
+        print(f"Resuming after {done} rows already in '{output_file}'...")
+    with open(output_file, 'a' if done is not None else 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, lineterminator=os.linesep)
+        if done is None:
+            writer.writeheader()
+        to_skip = done or 0
+        for chunk in chunks:
+            if to_skip >= len(chunk):
+                to_skip -= len(chunk)
+                continue
+            chunk = chunk.iloc[to_skip:]
+            to_skip = 0
+            for row in iter_enriched_rows(chunk, book_column, **options):
+                writer.writerow(row)
+                f.flush()
     print(f"Results saved to: {output_file}")
-    return df
+    return output_file
+
+def positive_int(value):
+    """argparse type for options that must be a whole number of at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
 
 if __name__ == "__main__":
     # Hide the main tkinter window
@@ -386,7 +863,14 @@ if __name__ == "__main__":
     parser.add_argument('--no-confirm', action='store_true', help='Skip manual confirmation for ambiguous matches')
     parser.add_argument('--auto-score', type=float, default=0.80, help='Absolute score threshold (0-1) to auto-select top match')
     parser.add_argument('--gap-threshold', type=float, default=0.12, help='Minimum gap between top and second score to auto-select')
+    parser.add_argument('--concurrency', type=positive_int, default=16, help='Maximum number of concurrent Goodreads searches')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the on-disk search cache')
+    parser.add_argument('--chunksize', type=positive_int, default=CHUNKSIZE, help=f'Search and write the CSV this many rows at a time (default: {CHUNKSIZE})')
+    parser.add_argument('--resume', action='store_true', help='Continue an interrupted run, keeping rows already in the output file')
+    parser.add_argument('--autocomplete', action='store_true', help="Search via Goodreads' compact autocomplete endpoint first (faster, but no publication years)")
     args, _ = parser.parse_known_args()
+    if args.no_cache:
+        CACHE_FILE = None
 
     try:
         process_book_csv(
@@ -396,6 +880,10 @@ if __name__ == "__main__":
             no_confirm=args.no_confirm,
             auto_score_threshold=args.auto_score,
             gap_threshold=args.gap_threshold,
+            concurrency=args.concurrency,
+            chunksize=args.chunksize,
+            resume=args.resume,
+            use_autocomplete=args.autocomplete,
         )
     except KeyboardInterrupt:
         print('\nInterrupted by user. Cleaning up...')
@@ -0,0 +1,28 @@
+import pytest
+
+import goodReadsFuzzyEnricher as enricher
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(enricher, 'CACHE_FILE', str(tmp_path / 'cache.sqlite'))
+    monkeypatch.setattr(enricher, '_search_cache', None)
+    return enricher.get_search_cache()
+
+
+@pytest.mark.skipif(not enricher.HTTPX_AVAILABLE, reason='httpx not installed')
+def test_interrupted_fetch_keeps_completed_searches(cache, monkeypatch):
+    queries = ['dune', 'emma', 'ulysses', 'beloved']
+
+    async def fake_search(client, query, sem, limiter, max_results=5, use_autocomplete=False):
+        if query == 'beloved':
+            raise RuntimeError("connection lost")
+        return [{'exact_title': query.title()}]
+
+    monkeypatch.setattr(enricher, 'search_goodreads_async', fake_search)
+    with pytest.raises(RuntimeError):
+        enricher.fetch_candidates(queries, delay=0)
+
+    cached = {q: cache.get(enricher._search_url(q), 5) for q in queries}
+    assert cached == {'dune': [{'exact_title': 'Dune'}], 'emma': [{'exact_title': 'Emma'}],
+                      'ulysses': [{'exact_title': 'Ulysses'}], 'beloved': None}
@@ -0,0 +1,38 @@
+import pytest
+
+import goodReadsFuzzyEnricher as enricher
+
+PARSERS = ['html.parser'] + (['lxml'] if enricher.LXML_AVAILABLE else [])
+
+
+@pytest.fixture(params=PARSERS)
+def parser(request, monkeypatch):
+    monkeypatch.setattr(enricher, 'HTML_PARSER', request.param)
+    return request.param
+
+
+def titles(html):
+    return [c['exact_title'] for c in enricher.parse_search_results(html.encode())]
+
+
+def test_book_box_with_extra_class(parser):
+    html = ('<html><body>'
+            '<div class="bookBox wide"><a class="bookTitle" href="/book/show/1-z">Z</a></div>'
+            '<div class="bookBox"><a class="bookTitle" href="/book/show/2-y">Y</a></div>'
+            '</body></html>')
+    assert titles(html) == ['Z', 'Y']
+
+
+def test_table_list_with_extra_class(parser):
+    html = ('<html><body><table class="tableList striped">'
+            '<tr><th>header</th></tr>'
+            '<tr><td><a class="bookTitle" href="/book/show/3-q">Q</a></td></tr>'
+            '</table></body></html>')
+    assert titles(html) == ['Q']
+
+
+def test_autocomplete_skips_malformed_items():
+    payload = b'[{"title": "Dune", "ratingsCount": "1,234", "author": {"name": "Frank Herbert"}}, "junk", {"title": "Emma", "author": null}]'
+    candidates = enricher.parse_autocomplete_results(payload)
+    assert [(c['exact_title'], c['author'], c['ratings_count']) for c in candidates] == [
+        ('Dune', 'Frank Herbert', 1234), ('Emma', '', 0)]
@@ -0,0 +1,65 @@
+import pytest
+
+import goodReadsFuzzyEnricher as enricher
+
+
+def fake_fetch(queries, **kwargs):
+    return [[{'exact_title': q.title(), 'author': 'A', 'publish_date': '2000', 'ratings_count': 1,
+              'goodreads_url': f'https://www.goodreads.com/book/show/{q}', 'image_url': ''}] for q in queries]
+
+
+def test_resume_skips_rows_already_written(tmp_path, monkeypatch):
+    input_file = tmp_path / 'books.csv'
+    input_file.write_text('Book Name,Note\ndune,a\n,b\nemma,c\nulysses,d\n')
+    output_file = tmp_path / 'out.csv'
+    monkeypatch.setattr(enricher, 'fetch_candidates', fake_fetch)
+
+    enricher.process_book_csv(str(input_file), 'Book Name', str(output_file), delay=0, no_confirm=True)
+    full = output_file.read_text()
+
+    # Simulate a run interrupted after the first two rows
+    output_file.write_text(''.join(full.splitlines(keepends=True)[:3]))
+    fetched = []
+    monkeypatch.setattr(enricher, 'fetch_candidates', lambda q, **kw: fetched.extend(q) or fake_fetch(q))
+    enricher.process_book_csv(str(input_file), 'Book Name', str(output_file), delay=0, no_confirm=True,
+                              chunksize=1, resume=True)
+
+    assert output_file.read_text() == full
+    assert fetched == ['emma', 'ulysses']
+
+
+def test_each_batch_is_written_before_the_next_is_fetched(tmp_path, monkeypatch):
+    input_file = tmp_path / 'books.csv'
+    input_file.write_text('Book Name\ndune\nemma\nulysses\n')
+    output_file = tmp_path / 'out.csv'
+    written_before_fetch = []
+
+    def fetch(queries, **kwargs):
+        written_before_fetch.append(len(output_file.read_text().splitlines()[1:]))
+        return fake_fetch(queries)
+
+    monkeypatch.setattr(enricher, 'fetch_candidates', fetch)
+    enricher.process_book_csv(str(input_file), 'Book Name', str(output_file), delay=0, no_confirm=True,
+                              chunksize=2)
+
+    assert written_before_fetch == [0, 2]
+
+
+def test_na_markers_in_book_column_are_not_searched(tmp_path, monkeypatch):
+    input_file = tmp_path / 'books.csv'
+    input_file.write_text('Book Name,Note\ndune,a\nN/A,b\n null ,c\nNaN,d\n,e\n')
+    output_file = tmp_path / 'out.csv'
+    fetched = []
+    monkeypatch.setattr(enricher, 'fetch_candidates', lambda q, **kw: fetched.extend(q) or fake_fetch(q))
+    enricher.process_book_csv(str(input_file), 'Book Name', str(output_file), delay=0, no_confirm=True)
+
+    assert fetched == ['dune']
+    lines = output_file.read_text().splitlines()
+    assert lines[2] == 'N/A,b,,,,0,'
+
+
+def test_concurrency_below_one_is_rejected(tmp_path):
+    input_file = tmp_path / 'books.csv'
+    input_file.write_text('Book Name\ndune\n')
+    with pytest.raises(ValueError, match='concurrency'):
+        enricher.process_book_csv(str(input_file), 'Book Name', str(tmp_path / 'out.csv'), concurrency=0)
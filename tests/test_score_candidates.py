@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+import goodReadsFuzzyEnricher as enricher
+
+
+def candidates(*titles):
+    return [{'exact_title': t} for t in titles]
+
+
+def test_scores_are_split_per_query():
+    pytest.importorskip('rapidfuzz')
+    scores = enricher.score_candidates(['dune', 'x'], [candidates('Dune', 'Dune Messiah'), []])
+    assert [len(s) for s in scores] == [2, 0]
+    assert scores[0].tolist() == pytest.approx([1.0, 0.96])
+
+
+def test_fallback_scores_are_split_per_query(monkeypatch):
+    monkeypatch.setattr(enricher, 'RAPIDFUZZ_AVAILABLE', False)
+    scores = enricher.score_candidates(['dune', 'x'], [candidates('Dune', 'Dune Messiah'), []])
+    assert [len(s) for s in scores] == [2, 0]
+    # 'dune' vs 'dune messiah': Jaccard 1/2, Jaro 7/9 boosted by a 4-character prefix
+    assert scores[0].tolist() == pytest.approx([1.0, 0.6 * 0.5 + 0.4 * (7 / 9 + 0.4 * 2 / 9)])
+
+
+def test_rapidfuzz_without_cpdist_matches_batched_scores(monkeypatch):
+    pytest.importorskip('rapidfuzz')
+    args = (['dune', 'harry potter'], [candidates('Dune', 'Children of Dune'), candidates('Potter Harry', 'Other')])
+    batched = enricher.score_candidates(*args)
+
+    class OldProcess:
+        pass
+
+    monkeypatch.setattr(enricher, 'process', OldProcess())
+    per_pair = enricher.score_candidates(*args)
+    for a, b in zip(batched, per_pair):
+        assert a.tolist() == b.tolist()
+
+
+def test_jaro_winkler_known_values():
+    assert enricher.jaro_winkler('martha', 'marhta') == pytest.approx(0.9611111)
+    assert enricher.jaro_winkler('dune', 'dune') == 1.0
+    assert enricher.jaro_winkler('dune', '') == 0.0
+    assert enricher.jaro_winkler('abc', 'xyz') == 0.0
+
+
+def test_jaro_winkler_matches_rapidfuzz():
+    JaroWinkler = pytest.importorskip('rapidfuzz.distance').JaroWinkler
+    rng = random.Random(0)
+    for _ in range(2000):
+        s1 = ''.join(rng.choices('abcde ', k=rng.randint(0, 12)))
+        s2 = ''.join(rng.choices('abcde ', k=rng.randint(0, 12)))
+        assert enricher.jaro_winkler(s1, s2) == pytest.approx(JaroWinkler.similarity(s1, s2)), (s1, s2)